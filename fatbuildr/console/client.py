@@ -29,8 +29,6 @@ import atexit
 import socket
 import logging
 
-import requests
-
 from . import ConsoleMessage
 from ..log import logr
 from ..log.formatters import LOG_LEVEL_ANSI_STYLES, TASK_LOG
@@ -38,22 +36,22 @@ from ..log.formatters import LOG_LEVEL_ANSI_STYLES, TASK_LOG
 logger = logr(__name__)
 
 
-def _is_task_end_log_entry(entry):
-    """Returns True if the given log entry indicates task end, False
-    otherwise."""
-    msg = entry.split(':')[1]
-    if msg.startswith("Task failed") or msg.startswith("Task succeeded"):
-        return True
-    return False
+# Size of the blocks read in archived tasks journals in binary mode.
+JOURNAL_BLOCK_SIZE = 64 * 1024
+
+# Prefixes of the log messages that indicate task end.
+TASK_END_PREFIXES = (b"Task failed", b"Task succeeded")
 
 
 def _is_task_end_msg(msg):
     """Returns True if the given ConsoleMessage indicates task end, False
     otherwise."""
     if msg.IS_LOG:
-        # The remote server sent log record, print it on stdout.
-        entry = msg.data.decode()
-        return _is_task_end_log_entry(entry)
+        # The remote server sent log record, check its message directly in
+        # bytes after the level prefix, without decoding nor copying the log
+        # record.
+        data = msg.data
+        return data.startswith(TASK_END_PREFIXES, data.index(b':') + 1)
     return False
 
 
@@ -191,9 +189,8 @@ def tty_client_console(io):
                         tty_console_renderer_raw(msg.data)
                     elif msg.IS_LOG:
                         # The remote server sent log record, print it on stdout.
-                        entry = msg.data.decode()
-                        tty_console_renderer_log(entry)
-                        if _is_task_end_log_entry(entry):
+                        tty_console_renderer_log(msg.data)
+                        if _is_task_end_msg(msg):
                             logger.debug("Remote task is over, leaving")
                             # Raise an exception as there is no way to break the
                             # while loop from here.
@@ -234,54 +231,63 @@ def console_unix_client(io, binary):
     connection.connect(str(io.console))
     logger.debug("Connected to console socket %s", io.console)
 
+    # Read the socket through a buffered file object, to avoid multiple recv()
+    # syscalls for every ConsoleMessage.
+    fh = connection.makefile('rb')
+
     def reader(size):
-        data = connection.recv(size)
-        max_retries = 2
-        retries = 0
-        last_data_size = 0
-        # Retry until enough data has been received.
-        while len(data) < size:
-            # Check up to max_retries times more data has been received or
-            # return empty binary result to stop ConsoleMessage.read()
-            # processing. This can typically happen when fatbuildrd fail and
-            # the connection to unix server is closed inadvertently by the
-            # server.
-            if len(data) == last_data_size:
-                retries += 1
-                if retries == max_retries:
-                    logger.warn(
-                        f"{max_retries+1} successive failures to read data "
-                        "from console server"
-                    )
-                    return b""
-            else:
-                # Reset retry counter.
-                last_data_size = len(data)
-                retries = 0
-            missing = size - len(data)
-            data += connection.recv(missing)
+        data = fh.read(size)
+        # Return empty binary result to stop ConsoleMessage.read() processing
+        # when the connection is closed before enough data is received. This
+        # can typically happen when fatbuildrd fail and the connection to unix
+        # server is closed inadvertently by the server.
+        if len(data) < size:
+            if len(data):
+                logger.warn("Unable to read all data from console server")
+            return b""
         return data
 
     yield from _console_generator(binary, reader=reader)
 
     # Close all open fd and epoll
+    fh.close()
     connection.close()
 
 
 def console_reader(io, binary):
     """Read the given task I/O journal and generates the ConsoleMessage received
     on the socket. If binary argument is False, ConsoleMessage are generated as
-    objects. Otherwise they are generated in bytes.
+    objects. Otherwise the raw journal is generated in blocks of bytes.
 
     This function is supposed to be called for archived tasks only."""
     with open(io.journal.path, 'rb') as fh:
-        yield from _console_generator(binary, fd=fh.fileno())
+        # The journal is read once from the beginning to the end, advise the
+        # kernel to perform more aggressive readahead on this file.
+        os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if binary:
+            # The journal is the concatenation of the raw ConsoleMessages of
+            # the task, the last one being the task end log record as the task
+            # logging handler is unplugged right after. Then in binary mode, the
+            # journal is generated in large blocks without parsing messages.
+            while True:
+                data = fh.read(JOURNAL_BLOCK_SIZE)
+                if not data:
+                    break
+                yield data
+        else:
+            # Read the journal through the buffered file object, to avoid
+            # multiple read() syscalls for every ConsoleMessage.
+            yield from _console_generator(binary, reader=fh.read)
 
 
 def console_http_client(response):
     """Reads and generates the ConsoleMessage available in the given HTTP
     response object."""
 
+    # Import requests here as it is required by this function only, to avoid
+    # loading this library in the DBus clients which import this module.
+    import requests
+
     iterator = response.iter_content(chunk_size=32)
     buffer = next(iterator)
 
@@ -352,8 +358,7 @@ def tty_console_renderer(console_generator):
             tty_console_renderer_raw(msg.data)
         elif msg.IS_LOG:
             # The remote server sent log record, print it on stdout.
-            entry = msg.data.decode()
-            tty_console_renderer_log(entry)
+            tty_console_renderer_log(msg.data)
 
 
 def tty_console_renderer_raw(data):
@@ -363,14 +368,16 @@ def tty_console_renderer_raw(data):
 
 
 def tty_console_renderer_log(entry):
-    """Parses task log entry as formatted by ConsoleFormatter and write it on
-    user terminal stdout."""
-    level, msg = entry.split(':', 1)
+    """Parses task log entry in bytes as formatted by ConsoleFormatter and write
+    it on user terminal stdout."""
+    level, msg = entry.split(b':', 1)
     level = int(level)
     # If the task remote log entry is at debug level and debug is level is
     # disabled in local logger, skip the log entry.
     if not logger.has_debug() and level == logging.DEBUG:
         return
+    # Decode the message only when it is actually printed.
+    msg = msg.decode()
     log_style = LOG_LEVEL_ANSI_STYLES[TASK_LOG]
     level_style = LOG_LEVEL_ANSI_STYLES[level]
     print(
@@ -331,6 +331,44 @@ class HistoryManager:
         form = TaskForm(**fields)
         form.save(task.place)
 
+    def _load_task(self, task_dir, form=None):
+        """Returns the ArchivedTask loaded from the given task directory. The
+        task form is loaded from the directory if not given in argument."""
+        if form is None:
+            form = TaskForm.fromArchive(task_dir)
+
+        fields = {
+            field.name: field.native(form)
+            for field in ProtocolRegistry().task_fields(form.name)
+            if field.archived
+        }
+
+        return ArchivedTask(task_dir.stem, task_dir, self.instance, **fields)
+
+    def get(self, task_id):
+        """Returns the archived task with the given ID, or None if not found in
+        archives directory."""
+        # Check the task ID is a plain directory name which does not point
+        # outside of archives directory.
+        if task_id in ('', '.', '..'):
+            return None
+        task_dir = self.path.joinpath(task_id)
+        if task_dir.parent != self.path or task_dir.name != task_id:
+            return None
+        if not task_dir.is_dir():
+            return None
+        try:
+            return self._load_task(task_dir)
+        except FileNotFoundError:
+            return None
+        except (AttributeError, KeyError) as err:
+            logger.error(
+                "Unable to load unsupported task %s: %s",
+                task_dir,
+                err,
+            )
+            return None
+
     def dump(self, limit, remove_malformed=False):
         """Returns up to limit last tasks found in archives directory."""
         tasks = []
@@ -341,6 +379,7 @@ class HistoryManager:
         if not self.path.exists():
             return tasks
 
+        forms = []
         for task_dir in self.path.iterdir():
             if not task_dir.is_dir():
                 logger.debug("skipping non directory %s", task_dir)
@@ -349,20 +388,7 @@ class HistoryManager:
                 logger.debug("skipping queued task workspace %s", task_dir)
                 continue
             try:
-                form = TaskForm.fromArchive(task_dir)
-
-                fields = {
-                    field.name: field.native(form)
-                    for field in ProtocolRegistry().task_fields(form.name)
-                    if field.archived
-                }
-
-                task = ArchivedTask(
-                    task_dir.stem, task_dir, self.instance, **fields
-                )
-
-                tasks.append(task)
-
+                forms.append((task_dir, TaskForm.fromArchive(task_dir)))
             except FileNotFoundError as err:
                 logger.error(
                     "Unable to load malformed task directory %s: %s",
@@ -374,18 +400,25 @@ class HistoryManager:
                         "Removing malformed task directory %s", task_dir
                     )
                     shutil.rmtree(task_dir)
+
+        # Sort task forms by submission timestamp, from the most recent to the
+        # oldest, so that only the tasks within the limit are loaded.
+        forms.sort(
+            key=lambda item: getattr(item[1], 'submission', 0), reverse=True
+        )
+
+        for task_dir, form in forms:
+            if limit and len(tasks) >= limit:
+                break
+            try:
+                tasks.append(self._load_task(task_dir, form))
             except (AttributeError, KeyError) as err:
                 logger.error(
                     "Unable to load unsupported task %s: %s",
                     task_dir,
                     err,
                 )
-        # sort tasks by submission date, from the most recent to the oldest
-        tasks.sort(key=lambda x: x.submission, reverse=True)
-        if limit:
-            return tasks[:limit]
-        else:
-            return tasks
+        return tasks
 
     def purge(self):
         """Purge tasks history with the policy and its limit value defined in
@@ -133,6 +133,14 @@ class InstancePipelines:
         """Return the list of distributions for the given format."""
         return [dist['name'] for dist in self._formats[format]]
 
+    def format_dists_envs(self, format):
+        """Return the list of (distribution, environment) tuples for the given
+        format. The environment is None if not defined for the
+        distribution."""
+        return [
+            (dist['name'], dist.get('env')) for dist in self._formats[format]
+        ]
+
     def derivative_formats(self, derivative):
         """Returns a set of formats supported by the derivative, proceeding
         recursively with derivatives extensions."""
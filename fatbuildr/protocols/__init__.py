@@ -19,13 +19,12 @@
 
 from urllib.parse import urlparse
 
-from .dbus.client import DBusInstanceClient
-from .http.client import HttpClient
-
-from .dbus.server import DBusServer
-
 from ..errors import FatbuildrRuntimeError
 
+# The clients and server modules are imported in factories only when actually
+# needed, so fatbuildrctl does not load DBus server modules and only loads the
+# modules of the protocol of the selected instance URI.
+
 
 class ClientFactory(object):
     @staticmethod
@@ -37,8 +36,12 @@ class ClientFactory(object):
                 raise FatbuildrRuntimeError(
                     "Instance must be defined in DBus URI"
                 )
+            from .dbus.client import DBusInstanceClient
+
             return DBusInstanceClient(address, uri.scheme, instance)
         elif uri.scheme in ['http', 'https']:
+            from .http.client import HttpClient
+
             return HttpClient(address, uri.scheme, token)
         else:
             raise FatbuildrRuntimeError(f"unsupported URI {uri}")
@@ -47,4 +50,6 @@ class ClientFactory(object):
 class ServerFactory(object):
     @staticmethod
     def get():
+        from .dbus.server import DBusServer
+
         return DBusServer()
@@ -17,12 +17,18 @@
 # You should have received a copy of the GNU General Public License
 # along with Fatbuildr.  If not, see <https://www.gnu.org/licenses/>.
 
-import inspect
+from functools import lru_cache
 
 from dasbus.connection import SystemMessageBus
 from dasbus.error import DBusError, ErrorMapper, get_error_decorator
 from dasbus.identifier import DBusServiceIdentifier, DBusInterfaceIdentifier
-from dasbus.typing import unwrap_variant, get_variant, Structure, List
+from dasbus.typing import (
+    unwrap_variant,
+    get_variant,
+    get_dbus_type,
+    Structure,
+    List,
+)
 
 from ..wire import (
     WireInstance,
@@ -36,8 +42,9 @@ from ..wire import (
     WireTaskJournal,
 )
 
-from ..exports import ProtocolRegistry, ExportableType
+from ..exports import ProtocolRegistry
 
+from ...errors import FatbuildrRuntimeError
 from ...log import logr
 
 logger = logr(__name__)
@@ -48,6 +55,11 @@ ERROR_MAPPER = ErrorMapper()
 # Define the message bus.
 BUS = SystemMessageBus(error_mapper=ERROR_MAPPER)
 
+# Reference to the protocol registry singleton, to avoid going through the
+# singleton metaclass every time fields are looked up. The registry is filled
+# later by register_protocols() but the instance remains the same.
+REGISTRY = ProtocolRegistry()
+
 # Define namespaces.
 FATBUILDR_NAMESPACE = ("org", "rackslab", "Fatbuildr")
 INSTANCES_NAMESPACE = (*FATBUILDR_NAMESPACE, "Instances")
@@ -85,6 +97,11 @@ class FatbuildrDBusErrorNoRunningTask(FatbuildrDBusError):
     pass
 
 
+@dbus_error("ErrorUnknownTask", namespace=FATBUILDR_NAMESPACE)
+class FatbuildrDBusErrorUnknownTask(FatbuildrDBusError):
+    pass
+
+
 @dbus_error("ErrorNoKeyring", namespace=FATBUILDR_NAMESPACE)
 class FatbuildrDBusErrorNoKeyring(FatbuildrDBusError):
     pass
@@ -100,49 +117,177 @@ class FatbuildrDBusErrorPipeline(FatbuildrDBusError):
     pass
 
 
-# Utilities to handle null values
+@dbus_error("ErrorServerStopping", namespace=FATBUILDR_NAMESPACE)
+class FatbuildrDBusErrorServerStopping(FatbuildrDBusError):
+    pass
+
 
+# Special values sent on the wire in replacement of None for str and int wire
+# types. The DBus protocol supports neither null values nor GVariant maybe
+# types.
+NULL_STR = '∅'
+NULL_INT = -1
 
-def valueornull(value):
-    """Returns string 'null' if value is None, returns the value unmodified
-    otherwise."""
-    return value or 'null'
+# DBus signatures of nested structures and lists of nested structures,
+# computed once to avoid parsing type hints for every variant.
+STRUCTURE_SIGNATURE = get_dbus_type(Structure)
+STRUCTURE_LIST_SIGNATURE = get_dbus_type(List[Structure])
+
+# Utilities to handle null values
 
 
-def valueornone(value):
-    """Returns None if the value is the string 'null', returns the value
-    unmodified otherwise."""
-    return None if value == 'null' else value
+def wire_special_null(wire_type):
+    """Returns the special value sent on the wire in replacement of None for
+    the given wire type, or None if the wire type has no special value. Special
+    values are converted back to None when decoded."""
+    if wire_type is int:
+        return NULL_INT
+    if wire_type is str:
+        return NULL_STR
+    return None
+
+
+def wire_null(wire_type):
+    """Returns the value sent on the wire in replacement of None for the given
+    wire type, or None if None cannot be sent for this wire type. For bool and
+    list wire types, None is sent as False and an empty list respectively, as
+    these types have no special value."""
+    null = wire_special_null(wire_type)
+    if null is not None:
+        return null
+    if wire_type is bool:
+        return False
+    if getattr(wire_type, '__origin__', None) in (list, List):
+        return []
+    return None
 
 
 # Utilities to manipulate TYPES_MAP
 
 
+@lru_cache(maxsize=None)
 def type_fields(type):
-    """Returns the set of ExportableFields for the given
-    FatbuildrNativeDBusData type."""
-    for native_type, dbus_type in TYPES_MAP:
-        if dbus_type is type:
-            return ProtocolRegistry().type_fields(native_type)
-    raise RuntimeError(f"Unable to find fields for type {type}")
+    """Returns the tuple of ExportableFields for the given
+    FatbuildrNativeDBusData type. The result is cached as the protocol registry
+    does not change after protocols registration."""
+    return REGISTRY.type_fields(native_type(type))
 
 
 def dbus_type(type_name):
     """Return the FatbuildrNativeDBusData type for the given ExportableType
     name."""
-    for native_type, dbus_type in TYPES_MAP:
-        if type_name == native_type:
-            return dbus_type
-    raise RuntimeError(f"Unable to find dbus type for {type_name}")
+    try:
+        return TYPES_MAP[type_name]
+    except KeyError:
+        raise RuntimeError(f"Unable to find dbus type for {type_name}")
 
 
 def native_type(type):
     """Returns the ExportableType name of the given FatbuildrNativeDBusData
     type."""
-    for native_type, dbus_type in TYPES_MAP:
-        if dbus_type is type:
-            return native_type
-    raise RuntimeError(f"Unable to find native type for {type}")
+    try:
+        return NATIVE_TYPES_MAP[type]
+    except KeyError:
+        raise RuntimeError(f"Unable to find native type for {type}")
+
+
+def field_encoder(field):
+    """Returns a function to convert the value of the given field in a native
+    object to a DBus variant."""
+    name = field.name
+
+    if field.exportable is not None:
+        if field.exportable_list:
+            # If the field wire type is a List[ExportableType], build a list
+            # of structures with the FatbuildrDBusData class of the contained
+            # type.
+            to_structure = dbus_type(field.exportable.__name__).to_structure
+
+            def to_wire(native_value):
+                return get_variant(
+                    STRUCTURE_LIST_SIGNATURE,
+                    [to_structure(value) for value in native_value],
+                )
+
+        else:
+            # If the type is directly exportable on the wire, convert it to
+            # (nested) structure.
+            to_structure = dbus_type(field.exportable.__name__).to_structure
+
+            def to_wire(native_value):
+                return get_variant(
+                    STRUCTURE_SIGNATURE, to_structure(native_value)
+                )
+
+        def encode(obj):
+            native_value = getattr(obj, name)
+            if native_value is None:
+                return get_variant(field.wire_type, NULL_STR)
+            return to_wire(native_value)
+
+    else:
+        export = field.export
+        signature = get_dbus_type(field.wire_type)
+        null = wire_null(field.wire_type)
+
+        def encode(obj):
+            wire_value = export(obj)
+            # DBus does not support None/null values, then handle this case
+            # with special values.
+            if wire_value is None:
+                if null is None:
+                    raise FatbuildrRuntimeError(
+                        f"Unable to send None value of field {name} with wire "
+                        f"type {field.wire_type} on DBus"
+                    )
+                wire_value = null
+            return get_variant(signature, wire_value)
+
+    return encode
+
+
+@lru_cache(maxsize=None)
+def fields_encoders(fields):
+    """Returns a tuple of pairs of field names and encoders for the given
+    fields. The result is cached as fields tuples do not change after
+    registration."""
+    return tuple((field.name, field_encoder(field)) for field in fields)
+
+
+def field_decoder(field):
+    """Returns a function to convert the DBus wire value of the given field to
+    its native value."""
+    if field.exportable_list:
+        # If the field wire type is a List[ExportableType], build a list of
+        # native objects corresponding to the FatbuildrDBusData class of the
+        # contained type.
+        from_structure = dbus_type(field.exportable.__name__).from_structure
+
+        def decode(wire_value):
+            return [from_structure(value) for value in wire_value]
+
+    elif field.exportable is not None:
+        # If the field has an exportable type, convert the structure to the
+        # corresponding FatbuildrNativeDBusData type.
+        decode = dbus_type(field.exportable.__name__).from_structure
+
+    else:
+        null = wire_special_null(field.wire_type)
+
+        def decode(wire_value):
+            if null is not None and wire_value == null:
+                return None
+            return field.native(value=wire_value)
+
+    return decode
+
+
+@lru_cache(maxsize=None)
+def fields_decoders(fields):
+    """Returns a dict of the decoders of the given fields indexed by field
+    names. The result is cached as fields tuples do not change after
+    registration."""
+    return {field.name: field_decoder(field) for field in fields}
 
 
 # Define structures.
@@ -155,6 +300,17 @@ class FatbuildrDBusData:
         :param structure: a DBus structure
         :return: a data object
         """
+        return cls._decode(fields_decoders(fields), structure)
+
+    @classmethod
+    def _decode(cls, decoders, structure: Structure):
+        """Convert a DBus structure to a data object with the given dict of
+        fields decoders.
+        :param decoders: a dict of fields decoders as returned by
+                         fields_decoders()
+        :param structure: a DBus structure
+        :return: a data object
+        """
         if not isinstance(structure, dict):
             raise TypeError(
                 "Invalid type '{}'.".format(type(structure).__name__)
@@ -162,35 +318,13 @@ class FatbuildrDBusData:
 
         data = cls()
 
-        for field in fields:
-            wire_value = unwrap_variant(structure[field.name])
-            if (field.wire_type is int and wire_value == -1) or (
-                field.wire_type is str and wire_value == '∅'
-            ):
-                native_value = None
-            elif inspect.isclass(field.wire_type) and issubclass(
-                field.wire_type, ExportableType
-            ):
-                # If the field has an exportable type, convert the structure to
-                # the corresponding FatbuildrNativeDBusData type.
-                native_value = dbus_type(
-                    field.wire_type.__name__
-                ).from_structure(wire_value)
-            # If the field wire type is a List[ExportableType], build a list of
-            # native objects corresponding to the FatbuildrDBusData class of the
-            # contained type.
-            elif isinstance(
-                field.wire_type, type(List[ExportableType])
-            ) and issubclass(field.wire_type.__args__[0], ExportableType):
-                native_value = [
-                    dbus_type(
-                        field.wire_type.__args__[0].__name__
-                    ).from_structure(value)
-                    for value in wire_value
-                ]
-            else:
-                native_value = field.native(value=wire_value)
-            setattr(data, field.name, native_value)
+        # Iterate over the structure items and dispatch to the decoders of the
+        # corresponding fields. Unknown items are ignored.
+        for name, variant in structure.items():
+            decode = decoders.get(name)
+            if decode is None:
+                continue
+            setattr(data, name, decode(unwrap_variant(variant)))
 
         return data
 
@@ -200,46 +334,7 @@ class FatbuildrDBusData:
         :return: a DBus structure
         """
 
-        structure = {}
-
-        for field in fields:
-            native_value = getattr(task, field.name)
-            # DBus does not support None/null values, then handle this case
-            # with special values.
-            if native_value is None:
-                if field.wire_type is int:
-                    wire_value = -1
-                else:
-                    wire_value = '∅'
-                wire_type = field.wire_type
-            elif inspect.isclass(field.wire_type) and issubclass(
-                field.wire_type, ExportableType
-            ):
-                # If the type is directly exportable on the wire, convert it
-                # to (nested) structure.
-                wire_value = dbus_type(field.wire_type.__name__).to_structure(
-                    native_value
-                )
-                wire_type = Structure
-            # If the field wire type is a List[ExportableType], build a list of
-            # structure with the FatbuildrDBusData class of the contained type.
-            elif isinstance(
-                field.wire_type, type(List[ExportableType])
-            ) and issubclass(field.wire_type.__args__[0], ExportableType):
-                wire_value = [
-                    dbus_type(
-                        field.wire_type.__args__[0].__name__
-                    ).to_structure(value)
-                    for value in native_value
-                ]
-                wire_type = List[Structure]
-            else:
-                wire_value = field.export(task)
-                wire_type = field.wire_type
-
-            structure[field.name] = get_variant(wire_type, wire_value)
-
-        return structure
+        return {name: encode(task) for name, encode in fields_encoders(fields)}
 
     @classmethod
     def from_structure_list(cls, structures: List[Structure]):
@@ -267,12 +362,12 @@ class DBusRunnableTask(FatbuildrDBusData, WireRunnableTask):
     @classmethod
     def from_structure(cls, structure: Structure):
         task_name = unwrap_variant(structure['name'])
-        fields = ProtocolRegistry().task_fields(task_name)
+        fields = REGISTRY.task_fields(task_name)
         return super().from_structure(fields, structure)
 
     @classmethod
     def to_structure(cls, task) -> Structure:
-        fields = ProtocolRegistry().task_fields(task.name)
+        fields = REGISTRY.task_fields(task.name)
         return super().to_structure(fields, task)
 
 
@@ -281,16 +376,57 @@ class FatbuildrNativeDBusData(FatbuildrDBusData):
     def from_structure(cls, structure: Structure):
         return super().from_structure(type_fields(cls), structure)
 
+    @classmethod
+    def from_structure_list(cls, structures: List[Structure]):
+        """Convert DBus structures to data objects. All structures have the
+        fields of this type, then the fields decoders are resolved once for the
+        whole list.
+        :param structures: a list of DBus structures
+        :return: a list of data objects
+        """
+        if not isinstance(structures, list):
+            raise TypeError(
+                "Invalid type '{}'.".format(type(structures).__name__)
+            )
+
+        decoders = fields_decoders(type_fields(cls))
+        decode = cls._decode
+        return [decode(decoders, structure) for structure in structures]
+
     @classmethod
     def to_structure(cls, task) -> Structure:
         return super().to_structure(type_fields(cls), task)
 
+    @classmethod
+    def to_structure_list(cls, objects) -> List[Structure]:
+        """Convert data objects to DBus structures. All objects have the
+        fields of this type, then the fields encoders are resolved once for the
+        whole list.
+        :param objects: a list of data objects
+        :return: a list of DBus structures
+        """
+        encoders = fields_encoders(type_fields(cls))
+        return [
+            {name: encode(obj) for name, encode in encoders} for obj in objects
+        ]
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def native_loader(cls):
+        """Returns the loader of the native type corresponding to this
+        FatbuildrNativeDBusData type along with the names of its fields. The
+        result is cached as the protocol registry does not change after
+        protocols registration."""
+        return (
+            REGISTRY.type_loader(native_type(cls)),
+            tuple(field.name for field in type_fields(cls)),
+        )
+
     def to_native(self):
-        kwargs = {
-            field.name: getattr(self, field.name)
-            for field in type_fields(type(self))
-        }
-        return ProtocolRegistry().type_loader(native_type(type(self)))(**kwargs)
+        # Native types constructors do not declare their arguments in fields
+        # order, then the fields values must be given as keyword arguments.
+        loader, names = self.native_loader()
+        return loader(**{name: getattr(self, name) for name in names})
 
 
 class DBusInstance(FatbuildrNativeDBusData, WireInstance):
@@ -329,16 +465,23 @@ class DBusTaskJournal(FatbuildrNativeDBusData, WireTaskJournal):
     pass
 
 
-# Map fatbuildr native exportable types with corresponding dbus types
+# Map fatbuildr native exportable types names with corresponding dbus types
 
 TYPES_MAP = {
-    ('RunningInstance', DBusInstance),
-    ('ArtifactSourceArchive', DBusSourceArchive),
-    ('RegistryArtifact', DBusArtifact),
-    ('ChangelogEntry', DBusChangelogEntry),
-    ('ArtifactMember', DBusArtifactMember),
-    ('KeyringMasterKey', DBusKeyring),
-    ('KeyringSubKey', DBusKeyringSubKey),
-    ('TaskIO', DBusTaskIO),
-    ('TaskJournal', DBusTaskJournal),
+    'RunningInstance': DBusInstance,
+    'ArtifactSourceArchive': DBusSourceArchive,
+    'RegistryArtifact': DBusArtifact,
+    'ChangelogEntry': DBusChangelogEntry,
+    'ArtifactMember': DBusArtifactMember,
+    'KeyringMasterKey': DBusKeyring,
+    'KeyringSubKey': DBusKeyringSubKey,
+    'TaskIO': DBusTaskIO,
+    'TaskJournal': DBusTaskJournal,
+}
+
+# Reverse map of dbus types with corresponding fatbuildr native exportable
+# types names
+
+NATIVE_TYPES_MAP = {
+    dbus_type: native_type for native_type, dbus_type in TYPES_MAP.items()
 }
@@ -17,6 +17,8 @@
 # You should have received a copy of the GNU General Public License
 # along with Fatbuildr.  If not, see <https://www.gnu.org/licenses/>.
 
+from functools import lru_cache
+
 from . import (
     FATBUILDR_SERVICE,
     DBusInstance,
@@ -30,6 +32,7 @@ from . import (
     FatbuildrDBusErrorNotAuthorized,
     FatbuildrDBusErrorUnknownInstance,
     FatbuildrDBusErrorNoRunningTask,
+    FatbuildrDBusErrorUnknownTask,
     FatbuildrDBusErrorNoKeyring,
     FatbuildrDBusErrorRegistry,
 )
@@ -67,11 +70,34 @@ def check_dbus_errors(method):
     return error_handler_wrapper
 
 
+@lru_cache(maxsize=None)
+def service_proxy():
+    """Returns the proxy of the Fatbuildr DBus service. DBus proxies introspect
+    the remote object on first access to its members. The proxy is cached, so
+    clients created in the same process (eg. for every fatbuildrweb request)
+    share the result of the introspection."""
+    return FATBUILDR_SERVICE.get_proxy()
+
+
+@lru_cache(maxsize=None)
+def object_proxy(object_path):
+    """Returns the proxy of the Fatbuildr DBus object at the given path. As for
+    the service proxy, the result is cached."""
+    return FATBUILDR_SERVICE.get_proxy(object_path)
+
+
+def instance_proxy(instance):
+    """Returns the proxy of the given Fatbuildr instance DBus object. The object
+    path of the instance is requested to the service on every call, so that
+    instances removed from the server are reported as unknown instances."""
+    return object_proxy(service_proxy().GetInstance(instance))
+
+
 class DBusServiceClient(AbstractClient):
     @check_dbus_errors
     def __init__(self, uri, scheme):
         super().__init__(uri, scheme)
-        self.proxy = FATBUILDR_SERVICE.get_proxy()
+        self.proxy = service_proxy()
 
     @check_dbus_errors
     def instances(self):
@@ -84,12 +110,23 @@ class DBusInstanceClient(AbstractClient):
         super().__init__(uri, scheme)
         self.service = DBusServiceClient(uri, scheme)
         try:
-            obj_path = self.service.proxy.GetInstance(instance)
+            self.proxy = instance_proxy(instance)
         except FatbuildrDBusErrorUnknownInstance:
             raise FatbuildrServerInstanceError(
                 f"Unknown instance {instance} at {uri}"
             )
-        self.proxy = FATBUILDR_SERVICE.get_proxy(obj_path)
+        # Cache of pipelines queries results, see _pipelines_query().
+        self._pipelines = {}
+
+    def _pipelines_query(self, key, query):
+        """Returns the result of the given pipelines query function. The
+        pipelines of an instance are loaded once by the server, then the result
+        is cached with the given key for the lifetime of the client."""
+        try:
+            return self._pipelines[key]
+        except KeyError:
+            result = self._pipelines[key] = query()
+            return result
 
     # instances and pipelines
     @check_dbus_errors
@@ -98,34 +135,72 @@ class DBusInstanceClient(AbstractClient):
 
     @check_dbus_errors
     def pipelines_formats(self):
-        return self.proxy.PipelinesFormats
+        return self._pipelines_query(
+            ('formats',), lambda: self.proxy.PipelinesFormats
+        )
 
     @check_dbus_errors
     def pipelines_architectures(self):
-        return self.proxy.PipelinesArchitectures
+        return self._pipelines_query(
+            ('architectures',), lambda: self.proxy.PipelinesArchitectures
+        )
 
     @check_dbus_errors
     def pipelines_format_distributions(self, format):
-        return self.proxy.PipelinesFormatDistributions(format)
+        return self._pipelines_query(
+            ('format_distributions', format),
+            lambda: self.proxy.PipelinesFormatDistributions(format),
+        )
 
     @check_dbus_errors
     def pipelines_distribution_format(self, distribution):
-        return self.proxy.PipelinesDistributionFormat(distribution)
+        return self._pipelines_query(
+            ('distribution_format', distribution),
+            lambda: self.proxy.PipelinesDistributionFormat(distribution),
+        )
 
     @check_dbus_errors
     def pipelines_distribution_derivatives(self, distribution):
-        return self.proxy.PipelinesDistributionDerivatives(distribution)
+        return self._pipelines_query(
+            ('distribution_derivatives', distribution),
+            lambda: self.proxy.PipelinesDistributionDerivatives(distribution),
+        )
 
     @check_dbus_errors
     def pipelines_distribution_environment(self, distribution):
-        env = self.proxy.PipelinesDistributionEnvironment(distribution)
+        env = self._pipelines_query(
+            ('distribution_environment', distribution),
+            lambda: self.proxy.PipelinesDistributionEnvironment(distribution),
+        )
         if env == 'none':
             return None
         return env
 
+    @check_dbus_errors
+    def pipelines_distributions(self):
+        """Returns a dict of lists of (distribution, environment, derivatives)
+        tuples indexed by format. Environment is None when not defined."""
+        return self._pipelines_query(
+            ('distributions',),
+            lambda: {
+                format: [
+                    (
+                        distribution,
+                        None if environment == 'none' else environment,
+                        derivatives,
+                    )
+                    for distribution, environment, derivatives in dists
+                ]
+                for format, dists in self.proxy.PipelinesDistributions.items()
+            },
+        )
+
     @check_dbus_errors
     def pipelines_derivative_formats(self, derivative):
-        return self.proxy.PipelinesDerivativeFormats(derivative)
+        return self._pipelines_query(
+            ('derivative_formats', derivative),
+            lambda: self.proxy.PipelinesDerivativeFormats(derivative),
+        )
 
     # registries
 
@@ -147,6 +222,21 @@ class DBusInstanceClient(AbstractClient):
             self.proxy.Artifacts(fmt, distribution, derivative)
         )
 
+    @check_dbus_errors
+    def artifacts_search(self, artifact):
+        return {
+            fmt: {
+                distribution: {
+                    derivative: DBusArtifact.from_structure_list(artifacts)
+                    for derivative, artifacts in derivatives.items()
+                }
+                for distribution, derivatives in distributions.items()
+            }
+            for fmt, distributions in self.proxy.ArtifactsSearch(
+                artifact
+            ).items()
+        }
+
     @check_dbus_errors
     def delete_artifact(self, fmt, distribution, derivative, artifact):
         return self.proxy.ArtifactDelete(
@@ -283,30 +373,28 @@ class DBusInstanceClient(AbstractClient):
     def history_purge(self):
         return self.proxy.HistoryPurge()
 
+    @check_dbus_errors
     def get(self, task_id):
-        for _task in self.queue():
-            if _task.id == task_id:
-                return _task
-        _running = self.running()
-        if _running and _running.id == task_id:
-            return _running
-        for _task in self.history(limit=0):
-            if _task.id == task_id:
-                return _task
-        raise FatbuildrServerError(f"Unable to find task {task_id} on server")
+        try:
+            return DBusRunnableTask.from_structure(self.proxy.GetTask(task_id))
+        except FatbuildrDBusErrorUnknownTask:
+            raise FatbuildrServerError(
+                f"Unable to find task {task_id} on server"
+            )
 
     def watch(self, task, binary=False):
-        """Returns a generator of the given task ConsoleMessages output."""
-        assert hasattr(task, 'io')
+        """Returns a generator of the given task ConsoleMessages output. The
+        task must have an io attribute, AttributeError is raised otherwise."""
+        io = task.io
         if task.state == 'running':
-            return console_unix_client(task.io, binary)
+            return console_unix_client(io, binary)
         else:
-            return console_reader(task.io, binary)
+            return console_reader(io, binary)
 
     def attach(self, task):
         """Setup user terminal to follow output of task running on server
-        side."""
-        assert hasattr(task, 'io')
+        side. The task must have an io attribute, AttributeError is raised
+        otherwise."""
         tty_client_console(task.io)
 
     # keyring
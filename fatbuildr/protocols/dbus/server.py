@@ -18,6 +18,7 @@
 # along with Fatbuildr.  If not, see <https://www.gnu.org/licenses/>.
 
 import pwd
+from concurrent.futures import ThreadPoolExecutor
 
 from dasbus.loop import EventLoop
 from dasbus.server.interface import dbus_interface, accepts_additional_arguments
@@ -25,7 +26,17 @@ from dasbus.server.handler import ServerObjectHandler
 from dasbus.server.template import InterfaceTemplate
 from dasbus.server.publishable import Publishable
 from dasbus.namespace import get_dbus_path
-from dasbus.typing import Structure, List, Str, Int, Bool, Variant, ObjPath
+from dasbus.typing import (
+    Structure,
+    List,
+    Dict,
+    Tuple,
+    Str,
+    Int,
+    Bool,
+    Variant,
+    ObjPath,
+)
 from dasbus.xml import XMLGenerator
 
 from . import (
@@ -43,9 +54,11 @@ from . import (
     FatbuildrDBusErrorNotAuthorized,
     FatbuildrDBusErrorUnknownInstance,
     FatbuildrDBusErrorNoRunningTask,
+    FatbuildrDBusErrorUnknownTask,
     FatbuildrDBusErrorNoKeyring,
     FatbuildrDBusErrorRegistry,
     FatbuildrDBusErrorPipeline,
+    FatbuildrDBusErrorServerStopping,
 )
 from ...errors import (
     FatbuildrPipelineError,
@@ -63,6 +76,9 @@ REQUIRE_POLKIT_AUTHORIZATION_ATTRIBUTE = (
     "__dbus_handler_require_polkit_authorization__"
 )
 
+# Method attribute for the @run_in_thread decorator.
+RUN_IN_THREAD_ATTRIBUTE = "__dbus_handler_run_in_thread__"
+
 
 def dbus_user(sender):
     """Returns a tuple container the UID and the name of the user initiating the
@@ -86,9 +102,58 @@ def require_polkit_authorization(action):
     return wrap
 
 
+def run_in_thread(method):
+    """Decorator for InterfaceTemplate methods to run the method in a thread of
+    the DBusServer pool instead of the server event loop, so that the server
+    can handle other clients requests in the meantime. This is intended for
+    methods which can take time to read data on disk or run external commands.
+    The decorator actually defines an attribute on the method, this attribute
+    is consumed by TimeredAuthorizationServerObjectHandler."""
+    setattr(method, RUN_IN_THREAD_ATTRIBUTE, True)
+    return method
+
+
 class TimeredAuthorizationServerObjectHandler(ServerObjectHandler):
-    """Child class of dasbus ServerObjectHandler just to override _handle_call()
-    method."""
+    """Child class of dasbus ServerObjectHandler to override _method_callback()
+    and _handle_call() methods."""
+
+    def _method_callback(
+        self, invocation, interface_name, method_name, parameters
+    ):
+        """This method checks if the @run_in_thread attribute has been defined
+        on the method. In this case, the call is submitted to the pool of
+        threads. Otherwise, it is handled in the server event loop."""
+        callback = super()._method_callback
+        handler = self._find_object_handler(interface_name, method_name)
+        if not getattr(handler, RUN_IN_THREAD_ATTRIBUTE, False):
+            callback(invocation, interface_name, method_name, parameters)
+            return
+
+        timer = self._object.implementation.timer
+
+        def run():
+            try:
+                callback(invocation, interface_name, method_name, parameters)
+            finally:
+                timer.unregister_worker(invocation)
+
+        # Register the call as a timer worker so fatbuildrd does not stop before
+        # the reply is sent.
+        timer.register_worker(invocation)
+        try:
+            self._object.implementation.executor.submit(run)
+        except RuntimeError:
+            # The pool of threads is shut down as the server is stopping, send
+            # an error reply to the caller.
+            timer.unregister_worker(invocation)
+            self._handle_method_error(
+                invocation,
+                interface_name,
+                method_name,
+                FatbuildrDBusErrorServerStopping(
+                    "server is stopping, retry later"
+                ),
+            )
 
     def _handle_call(
         self, interface_name, method_name, *parameters, **additional_args
@@ -168,13 +233,14 @@ class FatbuildrDBusServiceInterface(InterfaceTemplate):
 class FatbuildrDBusService(Publishable):
     """The implementation of the FatbuildrDBusService."""
 
-    def __init__(self, instances, timer):
+    def __init__(self, instances, timer, executor):
         self._dbus_instances = {}  # dict of Publishable FatbuildrDBusInstances
         self._running_instances = instances  # list of RunningInstances
         self.timer = timer
+        self.executor = executor
 
         for instance in instances:
-            obj = FatbuildrDBusInstance(instance, timer)
+            obj = FatbuildrDBusInstance(instance, timer, executor)
             object_path = get_dbus_path(
                 *INSTANCES_NAMESPACE,
                 instance.id,
@@ -222,6 +288,16 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
         instance."""
         return self.implementation.pipelines_architectures()
 
+    @property
+    @require_polkit_authorization("org.rackslab.Fatbuildr.view-pipeline")
+    def PipelinesDistributions(
+        self,
+    ) -> Dict[Str, List[Tuple[Str, Str, List[Str]]]]:
+        """Returns the distributions of all formats in the pipelines of the
+        instance with their environment and derivatives, indexed by format. The
+        environment is 'none' when not defined."""
+        return self.implementation.pipelines_distributions()
+
     @require_polkit_authorization("org.rackslab.Fatbuildr.view-pipeline")
     def PipelinesFormatDistributions(self, format: Str) -> List[Str]:
         """Returns the distributions of the given format in the pipelines of the
@@ -286,6 +362,7 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
             raise FatbuildrDBusErrorNoRunningTask()
         return DBusRunnableTask.to_structure(running)
 
+    @run_in_thread
     @require_polkit_authorization("org.rackslab.Fatbuildr.view-task")
     def History(self, limit: Int) -> List[Structure]:
         """The list of last limit tasks in history."""
@@ -293,6 +370,19 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
             self.implementation.history(limit)
         )
 
+    @run_in_thread
+    @require_polkit_authorization("org.rackslab.Fatbuildr.view-task")
+    def GetTask(self, task_id: Str) -> Structure:
+        """The task with the given ID, either pending in queue, running or in
+        history. FatbuildrDBusErrorUnknownTask is raised if the task is not
+        found."""
+        task = self.implementation.get_task(task_id)
+        if task is None:
+            raise FatbuildrDBusErrorUnknownTask(
+                f"Unable to find task {task_id}"
+            )
+        return DBusRunnableTask.to_structure(task)
+
     @accepts_additional_arguments
     @require_polkit_authorization("org.rackslab.Fatbuildr.purge-history")
     def HistoryPurge(self, *, call_info) -> Str:
@@ -325,6 +415,7 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
         except FatbuildrRegistryError as err:
             raise FatbuildrDBusErrorRegistry(err)
 
+    @run_in_thread
     @require_polkit_authorization("org.rackslab.Fatbuildr.view-registry")
     def Artifacts(
         self,
@@ -340,6 +431,29 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
         except FatbuildrRegistryError as err:
             raise FatbuildrDBusErrorRegistry(err)
 
+    @run_in_thread
+    @require_polkit_authorization("org.rackslab.Fatbuildr.view-registry")
+    def ArtifactsSearch(
+        self, artifact: Str
+    ) -> Dict[Str, Dict[Str, Dict[Str, List[Structure]]]]:
+        """The artifacts whose name contains the given string in all instance
+        registries, indexed by format, distribution and derivative."""
+        try:
+            return {
+                fmt: {
+                    distribution: {
+                        derivative: DBusArtifact.to_structure_list(artifacts)
+                        for derivative, artifacts in derivatives.items()
+                    }
+                    for distribution, derivatives in distributions.items()
+                }
+                for fmt, distributions in self.implementation.artifacts_search(
+                    artifact
+                ).items()
+            }
+        except FatbuildrRegistryError as err:
+            raise FatbuildrDBusErrorRegistry(err)
+
     @accepts_additional_arguments
     @require_polkit_authorization("org.rackslab.Fatbuildr.edit-registry")
     def ArtifactDelete(
@@ -383,6 +497,7 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
             DBusArtifact.from_structure(artifact).to_native(),
         )
 
+    @run_in_thread
     @require_polkit_authorization("org.rackslab.Fatbuildr.view-registry")
     def ArtifactBinaries(
         self,
@@ -402,6 +517,7 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
         except FatbuildrRegistryError as err:
             raise FatbuildrDBusErrorRegistry(err)
 
+    @run_in_thread
     @require_polkit_authorization("org.rackslab.Fatbuildr.view-registry")
     def ArtifactSource(
         self,
@@ -420,6 +536,7 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
         except FatbuildrRegistryError as err:
             raise FatbuildrDBusErrorRegistry(err)
 
+    @run_in_thread
     @require_polkit_authorization("org.rackslab.Fatbuildr.view-registry")
     def Changelog(
         self,
@@ -440,6 +557,7 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
         except FatbuildrRegistryError as err:
             raise FatbuildrDBusErrorRegistry(err)
 
+    @run_in_thread
     @require_polkit_authorization("org.rackslab.Fatbuildr.view-registry")
     def ArtifactContent(
         self,
@@ -663,9 +781,10 @@ class FatbuildrDBusInstanceInterface(InterfaceTemplate):
 class FatbuildrDBusInstance(Publishable):
     """The implementation of FatbuildrDBusInstanceInterface."""
 
-    def __init__(self, instance, timer):
+    def __init__(self, instance, timer, executor):
         self._instance = instance  # the corresponding Fatbuildr RunningInstance
         self.timer = timer
+        self.executor = executor
 
     def for_publication(self):
         """Return a DBus representation."""
@@ -695,6 +814,23 @@ class FatbuildrDBusInstance(Publishable):
     def pipelines_derivative_formats(self, derivative: Str):
         return self._instance.pipelines.derivative_formats(derivative)
 
+    def pipelines_distributions(self):
+        pipelines = self._instance.pipelines
+        result = {}
+        for format in pipelines.formats:
+            result[format] = []
+            for distribution, environment in pipelines.format_dists_envs(
+                format
+            ):
+                result[format].append(
+                    (
+                        distribution,
+                        'none' if environment is None else environment,
+                        pipelines.dist_derivatives(distribution),
+                    )
+                )
+        return result
+
     def queue(self):
         """The list of tasks in instance queue."""
         return self._instance.tasks_mgr.queue.dump()
@@ -707,6 +843,14 @@ class FatbuildrDBusInstance(Publishable):
         """The list of historical tasks."""
         return self._instance.history_mgr.dump(limit)
 
+    def get_task(self, task_id: Str):
+        """The task with the given ID in queue, running or in history, or None
+        if not found."""
+        for task in self._instance.tasks_mgr.fullqueue:
+            if task.id == task_id:
+                return task
+        return self._instance.history_mgr.get(task_id)
+
     def formats(self):
         return self._instance.registry_mgr.formats()
 
@@ -723,6 +867,11 @@ class FatbuildrDBusInstance(Publishable):
             fmt, distribution, derivative
         )
 
+    def artifacts_search(self, artifact: Str):
+        """Get all artifacts whose name contains the given string in all
+        registries."""
+        return self._instance.registry_mgr.search(artifact)
+
     def artifact_bins(
         self,
         fmt: Str,
@@ -795,24 +944,33 @@ class FatbuildrDBusInstance(Publishable):
 
 
 class DBusServer(object):
+    def __init__(self):
+        # Pool of threads to run the methods decorated by @run_in_thread.
+        self.executor = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix='dbus-handler'
+        )
+
     def run(self, instances, timer):
 
-        # Print the generated XML specification.
-        logger.debug(
-            "Fatbuildr DBus service interface generated:\n %s",
-            XMLGenerator.prettify_xml(
-                FatbuildrDBusServiceInterface.__dbus_xml__
-            ),
-        )
-        logger.debug(
-            "Fatbuildr DBus instance interface generated:\n %s",
-            XMLGenerator.prettify_xml(
-                FatbuildrDBusInstanceInterface.__dbus_xml__
-            ),
-        )
+        # Print the generated XML specification. The XML documents are
+        # prettified only when debug is enabled, as it is performed before the
+        # logger level is checked.
+        if logger.has_debug():
+            logger.debug(
+                "Fatbuildr DBus service interface generated:\n %s",
+                XMLGenerator.prettify_xml(
+                    FatbuildrDBusServiceInterface.__dbus_xml__
+                ),
+            )
+            logger.debug(
+                "Fatbuildr DBus instance interface generated:\n %s",
+                XMLGenerator.prettify_xml(
+                    FatbuildrDBusInstanceInterface.__dbus_xml__
+                ),
+            )
 
         # Create the Fatbuildr DBus Service.
-        service = FatbuildrDBusService(instances, timer)
+        service = FatbuildrDBusService(instances, timer, self.executor)
 
         # Publish the Fatbuildr DBus Service at /org/rackslab/Fatbuildr.
         BUS.publish_object(
@@ -829,9 +987,15 @@ class DBusServer(object):
         self.loop.run()
 
     def quit(self):
-        # Disconnect from the bus so the system manager takes back DBus service
+        # Disconnect from the bus to unpublish the objects, so no more calls are
+        # dispatched, and so the system manager takes back DBus service
         # handling and reactivate the service with the next coming client.
         logger.debug("Disconnecting service from DBus")
         BUS.disconnect()
         logger.debug("Exiting server event loop")
         self.loop.quit()
+        # Wait for the methods running in threads to send their replies. The
+        # replies are sent on the bus connection which is not closed by the
+        # disconnection.
+        logger.debug("Waiting for DBus handlers threads")
+        self.executor.shutdown(wait=True)
@@ -17,7 +17,7 @@
 # You should have received a copy of the GNU General Public License
 # along with Fatbuildr.  If not, see <https://www.gnu.org/licenses/>.
 
-import inspect
+import sys
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -41,7 +41,10 @@ class ExportableType:
 
 class ExportableField:
     def __init__(self, name, native_type=str):
-        self.name = name
+        # Field names are used as keys of all wire structures and exported
+        # dicts, interning them makes dict lookups with these keys succeed on
+        # identity comparison.
+        self.name = sys.intern(name)
         self.native_type = native_type
         if native_type is datetime:
             self.wire_type = int
@@ -49,6 +52,21 @@ class ExportableField:
             self.wire_type = str
         else:
             self.wire_type = native_type
+        # Determine once whether the field contains a nested ExportableType
+        # object or a list of ExportableType objects, so conversions do not
+        # have to inspect the field type every time. The exportable attribute
+        # is the contained ExportableType, or None for other fields.
+        self.exportable = None
+        self.exportable_list = False
+        if isinstance(native_type, type) and issubclass(
+            native_type, ExportableType
+        ):
+            self.exportable = native_type
+        elif isinstance(native_type, type(List[ExportableType])) and issubclass(
+            native_type.__args__[0], ExportableType
+        ):
+            self.exportable = native_type.__args__[0]
+            self.exportable_list = True
 
     def export(self, obj):
         """Convert field to wire type."""
@@ -59,16 +77,12 @@ class ExportableField:
             return int(value.timestamp())
         elif self.native_type is Path:
             return str(value)
-        elif inspect.isclass(self.native_type) and issubclass(
-            self.native_type, ExportableType
-        ):
-            return value.export()
-        # If the native type is a List[ExportableType], return a comprehensive
-        # list of contained items recursive exports.
-        elif isinstance(
-            self.native_type, type(List[ExportableType])
-        ) and issubclass(self.native_type.__args__[0], ExportableType):
+        elif self.exportable_list:
+            # If the native type is a List[ExportableType], return a
+            # comprehensive list of contained items recursive exports.
             return [_value.export() for _value in value]
+        elif self.exportable is not None:
+            return value.export()
         return value
 
     def native(self, obj=None, value=None):
@@ -83,16 +97,12 @@ class ExportableField:
             return datetime.fromtimestamp(value)
         elif self.native_type is Path:
             return Path(value)
-        elif inspect.isclass(self.native_type) and issubclass(
-            self.native_type, ExportableType
-        ):
+        elif self.exportable_list:
+            # If the native type is a List[ExportableType], return a
+            # comprehensive list of native objects of the contained type.
+            return [self.exportable(**_value) for _value in value]
+        elif self.exportable is not None:
             return self.native_type(**value)
-        # If the native type is a List[ExportableType], return a comprehensive
-        # list of native objects of the contained type.
-        elif isinstance(
-            self.native_type, type(List[ExportableType])
-        ) and issubclass(self.native_type.__args__[0], ExportableType):
-            return [self.native_type.__args__[0](**_value) for _value in value]
         return value
 
 
@@ -108,10 +118,17 @@ class ProtocolRegistry(metaclass=Singleton):
         self._tasks = {}
         self._types = {}
 
+    @staticmethod
+    def _freeze_fields(fields):
+        """Returns a tuple of the given fields sorted by name, so they are
+        iterated in a stable order and the result can be used as a key in
+        caches."""
+        return tuple(sorted(fields, key=lambda field: field.name))
+
     def register_task(self, task, loader=None):
         self._tasks[task.TASK_NAME] = {
             'loader': loader or task,
-            'fields': task.BASEFIELDS | task.EXFIELDS,
+            'fields': self._freeze_fields(task.BASEFIELDS | task.EXFIELDS),
         }
 
     def task_fields(self, task):
@@ -121,7 +138,10 @@ class ProtocolRegistry(metaclass=Singleton):
         return self._tasks[task]['loader']
 
     def register_type(self, type):
-        self._types[type.__name__] = {'loader': type, 'fields': type.EXFIELDS}
+        self._types[type.__name__] = {
+            'loader': type,
+            'fields': self._freeze_fields(type.EXFIELDS),
+        }
 
     def type_fields(self, type):
         return self._types[type]['fields']
@@ -35,7 +35,7 @@ from ..exports import ProtocolRegistry, ExportableType
 
 
 def type_fields(type):
-    """Returns the set of ExportableFields for the given
+    """Returns the tuple of ExportableFields for the given
     JsonData type."""
     for native_type, dbus_type, json_type in TYPES_MAP:
         if json_type is type:
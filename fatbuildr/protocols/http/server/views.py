@@ -227,21 +227,19 @@ def pipelines_formats(instance):
             abort(404, str(err))
     else:
         formats = connection.pipelines_formats()
+    # Retrieve the distributions of all formats with their environment and
+    # derivatives with a single request to the server.
+    pipelines = connection.pipelines_distributions()
     for format in formats:
         if filter_format and format != filter_format:
             continue
-        distributions = connection.pipelines_format_distributions(format)
-        for distribution in distributions:
+        for distribution, environment, derivatives in pipelines.get(
+            format, []
+        ):
             if filter_distribution and distribution != filter_distribution:
                 continue
-            environment = connection.pipelines_distribution_environment(
-                distribution
-            )
             if filter_environment and environment != filter_environment:
                 continue
-            derivatives = connection.pipelines_distribution_derivatives(
-                distribution
-            )
             if format not in result:
                 result[format] = []
             result[format].append(
@@ -453,29 +451,14 @@ def artifact_delete(
 @check_instance_token_permission('view-registry')
 def search(instance, output='html'):
     connection = get_connection(instance)
-    formats = connection.formats()
-    results = {}
 
     artifact = request.args.get('artifact')
 
     if not artifact:
         abort(400)
 
-    for fmt in formats:
-        distributions = connection.distributions(fmt)
-        for distribution in distributions:
-            derivatives = connection.derivatives(fmt, distribution)
-            for derivative in derivatives:
-                artifacts = connection.artifacts(fmt, distribution, derivative)
-                for _artifact in artifacts:
-                    if artifact in _artifact.name:
-                        if fmt not in results:
-                            results[fmt] = {}
-                        if distribution not in results[fmt]:
-                            results[fmt][distribution] = {}
-                        if derivative not in results[fmt][distribution]:
-                            results[fmt][distribution][derivative] = []
-                        results[fmt][distribution][derivative].append(_artifact)
+    # Search artifacts in all registries with a single request to the server.
+    results = connection.artifacts_search(artifact)
 
     if output == 'json':
         # Convert lists of WireArtifact into lists of dicts for JSON
@@ -143,6 +143,9 @@ class RegistryArtifact(ExportableType):
             and self.size == other.size
         )
 
+    def __hash__(self):
+        return hash((self.name, self.architecture, self.version, self.size))
+
 
 class ChangelogEntry(ExportableType):
 
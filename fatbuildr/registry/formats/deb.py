@@ -176,6 +176,7 @@ class RegistryDeb(Registry):
             return []
 
         artifacts = []
+        found = set()  # artifacts already in list, for fast lookups
         cmd = [
             'reprepro',
             '--basedir',
@@ -207,9 +208,10 @@ class RegistryDeb(Registry):
             # Architecture independant packages can appear multiple times in
             # reprepro command output as their duplicated for every
             # ${$architecture} in repository. We check the RegistryArtifact
-            # is not already present in list to avoid duplicated entries in
+            # has not already been found to avoid duplicated entries in
             # resulting list.
-            if artifact not in artifacts:
+            if artifact not in found:
+                found.add(artifact)
                 artifacts.append(artifact)
         return artifacts
 
@@ -217,6 +219,7 @@ class RegistryDeb(Registry):
         """Returns the list of binary deb packages generated by the given source
         deb package."""
         artifacts = []
+        found = set()  # artifacts already in list, for fast lookups
         cmd = [
             'reprepro',
             '--basedir',
@@ -248,9 +251,10 @@ class RegistryDeb(Registry):
             # Architecture independant packages can appear multiple times in
             # reprepro command output as their duplicated for every
             # ${$architecture} in repository. We check the RegistryArtifact
-            # is not already present in list to avoid duplicated entries in
+            # has not already been found to avoid duplicated entries in
             # resulting list.
-            if artifact not in artifacts:
+            if artifact not in found:
+                found.add(artifact)
                 artifacts.append(artifact)
         return artifacts
 
@@ -189,6 +189,7 @@ class RegistryRpm(Registry):
         """Returns the list of artifacts in rpm repository."""
         self._check_derivative(distribution, derivative)
         artifacts = []
+        found = set()  # artifacts already in list, for fast lookups
         for arch_dir in self.available_arch_dirs(distribution, derivative):
             md = cr.Metadata()
             try:
@@ -211,15 +212,17 @@ class RegistryRpm(Registry):
                 )
                 # Architecture independant packages can be duplicated in
                 # multiple architectures repositories. We check the
-                # RegistryArtifact is not already present in list to avoid
+                # RegistryArtifact has not already been found to avoid
                 # duplicated entries in resulting list.
-                if artifact not in artifacts:
+                if artifact not in found:
+                    found.add(artifact)
                     artifacts.append(artifact)
         return artifacts
 
     def artifact_bins(self, distribution, derivative, src_artifact):
         """Returns the list of binary RPM generated by the given source RPM."""
         artifacts = []
+        found = set()  # artifacts already in list, for fast lookups
         for arch_dir in self.available_arch_dirs(distribution, derivative):
             md = cr.Metadata()
             md.locate_and_load_xml(str(arch_dir))
@@ -241,9 +244,10 @@ class RegistryRpm(Registry):
                 )
                 # Architecture independant packages can be duplicated in
                 # multiple architectures repositories. We check the
-                # RegistryArtifact is not already present in list to avoid
+                # RegistryArtifact has not already been found to avoid
                 # duplicated entries in resulting list.
-                if artifact not in artifacts:
+                if artifact not in found:
+                    found.add(artifact)
                     artifacts.append(artifact)
         return artifacts
 
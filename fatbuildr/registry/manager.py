@@ -59,6 +59,30 @@ class RegistryManager:
         registry = self.factory(fmt)
         return registry.artifacts(distribution, derivative)
 
+    def search(self, artifact):
+        """Returns the artifacts whose name contains the given string in all
+        registries, in nested dicts indexed by format, distribution and
+        derivative. Derivatives without matching artifact are not present in
+        result."""
+        results = {}
+        for fmt in self.formats():
+            registry = self.factory(fmt)
+            for distribution in registry.distributions:
+                for derivative in registry.derivatives(distribution):
+                    artifacts = [
+                        _artifact
+                        for _artifact in registry.artifacts(
+                            distribution, derivative
+                        )
+                        if artifact in _artifact.name
+                    ]
+                    if not artifacts:
+                        continue
+                    results.setdefault(fmt, {}).setdefault(distribution, {})[
+                        derivative
+                    ] = artifacts
+        return results
+
     def artifact_bins(self, fmt, distribution, derivative, src_artifact):
         registry = self.factory(fmt)
         return registry.artifact_bins(distribution, derivative, src_artifact)
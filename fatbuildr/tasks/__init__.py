@@ -70,9 +70,11 @@ class TaskJournal(ExportableType):
         # until now.
         self.fh.flush()
 
+        # Read the journal through the buffered file object, to avoid multiple
+        # read() syscalls for every ConsoleMessage.
         with open(self.path, 'rb') as fh:
             while True:
-                msg = ConsoleMessage.read(fd=fh.fileno())
+                msg = ConsoleMessage.read(reader=fh.read)
                 if msg is None:
                     break  # stop the loop when EOF is reached
                 connection.sendall(msg.raw)
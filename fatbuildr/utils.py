@@ -25,8 +25,6 @@ import pwd
 import grp
 import re
 
-import requests
-
 from .log import logr
 
 logger = logr(__name__)
@@ -48,6 +46,10 @@ def shelljoin(cmd):
 
 
 def dl_file(url, path):
+    # Import requests here as it is required by this function only, to avoid
+    # loading this library in all modules which import utils.
+    import requests
+
     #  actual download and write in cache
     logger.debug("Downloading tarball %s and save in %s", url, path)
     dl = requests.get(url, allow_redirects=True)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2024 Rackslab
+#
+# This file is part of Fatbuildr.
+#
+# Fatbuildr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fatbuildr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fatbuildr.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+from dasbus.typing import get_variant, unwrap_variant, Structure
+
+from fatbuildr.protocols.crawler import register_protocols
+from fatbuildr.protocols.dbus import DBusRunnableTask
+
+
+class TestDBusRunnableTask(unittest.TestCase):
+    def setUp(self):
+        register_protocols()
+        self.task = SimpleNamespace(
+            id='shell',
+            user='john',
+            name='image shell',
+            submission=datetime(2024, 3, 1, 12, 0, 0),
+            place=Path('/tmp/shell'),
+            state='running',
+            result=None,
+            io=SimpleNamespace(
+                interactive=True,
+                console=Path('/tmp/shell/console.sock'),
+                journal=SimpleNamespace(path=Path('/tmp/shell/task.journal')),
+            ),
+            format='rpm',
+            term='xterm',
+            command=['ls', '-l'],
+        )
+
+    def _roundtrip(self):
+        structure = DBusRunnableTask.to_structure(self.task)
+        # Pack and unpack the structure as it is sent on the wire.
+        return DBusRunnableTask.from_structure(
+            unwrap_variant(get_variant(Structure, structure))
+        )
+
+    def test_roundtrip(self):
+        task = self._roundtrip()
+        self.assertEqual(task.id, 'shell')
+        self.assertEqual(task.submission, self.task.submission)
+        self.assertEqual(task.place, self.task.place)
+        self.assertIsNone(task.result)
+        self.assertTrue(task.io.interactive)
+        self.assertEqual(task.io.journal.path, self.task.io.journal.path)
+        self.assertEqual(task.command, ['ls', '-l'])
+
+    def test_roundtrip_none_bool(self):
+        self.task.io.interactive = None
+        self.assertFalse(self._roundtrip().io.interactive)
+
+    def test_roundtrip_none_list(self):
+        self.task.command = None
+        self.assertEqual(self._roundtrip().command, [])
@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2024 Rackslab
+#
+# This file is part of Fatbuildr.
+#
+# Fatbuildr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fatbuildr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fatbuildr.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+import tempfile
+import shutil
+from pathlib import Path
+from types import SimpleNamespace
+
+import yaml
+
+from fatbuildr.protocols.crawler import register_protocols
+from fatbuildr.history import HistoryManager, TaskForm
+
+
+class TestHistoryManager(unittest.TestCase):
+    def setUp(self):
+        register_protocols()
+        self.test_dir = tempfile.mkdtemp()
+        workspaces = Path(self.test_dir)
+        self.instance = SimpleNamespace(
+            id='test', tasks_mgr=SimpleNamespace(fullqueue=[])
+        )
+        conf = SimpleNamespace(tasks=SimpleNamespace(workspaces=workspaces))
+        self.path = workspaces.joinpath(self.instance.id)
+        self.path.mkdir()
+        # Task form in workspaces directory, outside of the instance archives
+        # directory.
+        self._write_form(workspaces, 'history purge', 50)
+        for task_id, submission in [
+            ('task1', 100),
+            ('task2', 300),
+            ('task3', 200),
+            ('task4', 400),
+        ]:
+            self._write_task(task_id, 'history purge', submission)
+        # Most recent task with an unsupported task name
+        self._write_task('unsupported', 'fail', 500)
+        # Task directory without task form
+        self.path.joinpath('malformed').mkdir()
+        self.history = HistoryManager(conf, self.instance)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    @staticmethod
+    def _write_form(path, name, submission):
+        with open(path.joinpath(TaskForm.YML_FILE), 'w+') as fh:
+            yaml.dump(
+                {
+                    'name': name,
+                    'user': 'john',
+                    'submission': submission,
+                    'result': 'success',
+                },
+                fh,
+            )
+
+    def _write_task(self, task_id, name, submission):
+        task_dir = self.path.joinpath(task_id)
+        task_dir.mkdir()
+        self._write_form(task_dir, name, submission)
+
+    def test_get(self):
+        task = self.history.get('task2')
+        self.assertEqual(task.id, 'task2')
+        self.assertEqual(task.name, 'history purge')
+        self.assertEqual(task.place, self.path.joinpath('task2'))
+
+    def test_get_missing(self):
+        self.assertIsNone(self.history.get('task5'))
+        self.assertIsNone(self.history.get('malformed'))
+        self.assertIsNone(self.history.get('unsupported'))
+
+    def test_get_outside(self):
+        self.assertIsNone(self.history.get(''))
+        self.assertIsNone(self.history.get('.'))
+        self.assertIsNone(self.history.get('..'))
+        self.assertIsNone(self.history.get('/etc'))
+        self.assertIsNone(self.history.get('../test'))
+        self.assertIsNone(self.history.get('task1/../task2'))
+
+    def test_dump(self):
+        self.assertEqual(
+            [task.id for task in self.history.dump(0)],
+            ['task4', 'task2', 'task3', 'task1'],
+        )
+
+    def test_dump_limit(self):
+        # The unsupported task is the most recent, it must be skipped without
+        # counting in the limit.
+        self.assertEqual(
+            [task.id for task in self.history.dump(2)], ['task4', 'task2']
+        )
+
+    def test_dump_skip_queued(self):
+        self.instance.tasks_mgr.fullqueue = [SimpleNamespace(id='task4')]
+        self.assertEqual(
+            [task.id for task in self.history.dump(2)], ['task2', 'task3']
+        )
+
+    def test_dump_missing_directory(self):
+        shutil.rmtree(self.path)
+        self.assertEqual(self.history.dump(2), [])
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+#
+# Copyright (C) 2024 Rackslab
+#
+# This file is part of Fatbuildr.
+#
+# Fatbuildr is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Fatbuildr is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with Fatbuildr.  If not, see <https://www.gnu.org/licenses/>.
+
+import unittest
+
+from fatbuildr.registry.manager import RegistryManager
+from fatbuildr.registry.formats import RegistryArtifact
+
+
+class StubRegistry:
+    """Registry with static artifacts indexed by distribution and
+    derivative."""
+
+    def __init__(self, artifacts):
+        self._artifacts = artifacts
+
+    @property
+    def distributions(self):
+        return list(self._artifacts.keys())
+
+    def derivatives(self, distribution):
+        return list(self._artifacts[distribution].keys())
+
+    def artifacts(self, distribution, derivative):
+        return self._artifacts[distribution][derivative]
+
+
+class StubRegistryManager(RegistryManager):
+    """RegistryManager with stub registries."""
+
+    def __init__(self, registries):
+        super().__init__(None, None)
+        self.registries = registries
+
+    def formats(self):
+        return list(self.registries.keys())
+
+    def factory(self, fmt):
+        return self.registries[fmt]
+
+
+class TestRegistryManager(unittest.TestCase):
+    def setUp(self):
+        self.fatbuildr_deb = RegistryArtifact('fatbuildr', 'src', '2.0-1', 0)
+        self.fatbuildr_bin = RegistryArtifact(
+            'fatbuildr', 'noarch', '2.0-1.el8', 1024
+        )
+        self.fatbuildr_web = RegistryArtifact(
+            'fatbuildr-web', 'noarch', '2.0-1.el8', 512
+        )
+        self.manager = StubRegistryManager(
+            {
+                'deb': StubRegistry(
+                    {
+                        'bookworm': {
+                            'main': [
+                                self.fatbuildr_deb,
+                                RegistryArtifact('slurm', 'src', '23.02-1', 0),
+                            ],
+                            'foo': [
+                                RegistryArtifact('slurm', 'src', '23.11-1', 0)
+                            ],
+                        },
+                        'trixie': {'main': []},
+                    }
+                ),
+                'rpm': StubRegistry(
+                    {
+                        'el8': {
+                            'main': [self.fatbuildr_bin, self.fatbuildr_web],
+                        },
+                    }
+                ),
+            }
+        )
+
+    def test_search(self):
+        self.assertEqual(
+            self.manager.search('fatbuildr'),
+            {
+                'deb': {'bookworm': {'main': [self.fatbuildr_deb]}},
+                'rpm': {
+                    'el8': {'main': [self.fatbuildr_bin, self.fatbuildr_web]}
+                },
+            },
+        )
+
+    def test_search_substring(self):
+        self.assertEqual(
+            self.manager.search('web'),
+            {'rpm': {'el8': {'main': [self.fatbuildr_web]}}},
+        )
+
+    def test_search_not_found(self):
+        self.assertEqual(self.manager.search('unknown'), {})